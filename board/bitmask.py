@@ -0,0 +1,26 @@
+'''
+Candidate bitmask helpers.
+
+A set of digits is stored as a 9-bit integer where bit k is set when
+digit k+1 is present, e.g. {1, 3, 9} -> 0b100000101.
+'''
+
+ALL_DIGITS = 0x1FF
+
+
+def digit_bit(num):
+  """Returns the mask with only the bit for num set."""
+  return 1 << (num - 1)
+
+
+def iter_digits(mask):
+  """Yields the digits present in mask in ascending order."""
+  while mask:
+    low = mask & -mask
+    yield low.bit_length()
+    mask ^= low
+
+
+def popcount(mask):
+  """Returns the number of digits present in mask."""
+  return mask.bit_count()
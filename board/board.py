@@ -1,15 +1,47 @@
 from board.colors import Colors
 from board.validator import Validator
-import copy
+from board.bitmask import ALL_DIGITS, digit_bit
+from board.units import BOX_OF, PEERS
+import sys
+
+# Byte translation mapping '0'..'9' to 0..9 (anything else lands above 9),
+# and the cell value stored for each digit
+CHAR_TO_DIGIT = bytes((char - 48) & 0xFF for char in range(256))
+CELL_VALUES = (None, 1, 2, 3, 4, 5, 6, 7, 8, 9)
+
+# Static grid lines used by the display functions
+BOX_BORDER = "+" + "---+" * 9
+CELL_BORDER = "+" + "   +" * 9
+ROW_FORMAT = "|" + " {}   {}   {} |" * 3
+CANDIDATE_BOX_BORDER = "+" + ("═" * 9 + "+") * 9
+CANDIDATE_CELL_BORDER = "+" + ("-" * 9 + "+") * 9
+CANDIDATE_ROW_FORMAT = "‖" + ((" {} " * 3 + "|") * 2 + " {} " * 3 + "‖") * 3
+# The three 3-digit display lines of a cell, indexed by its candidate mask
+CANDIDATE_DISPLAY = [
+    tuple(
+        tuple(num if mask & digit_bit(num) else " "
+              for num in range(i * 3 + 1, i * 3 + 4))
+        for i in range(3))
+    for mask in range(ALL_DIGITS + 1)]
 
 class Board:
 
   def __init__(self, board_string):
     self.cells = self.string_to_board(board_string)
-    self.original = copy.deepcopy(self.cells)
+    self.original = [row[:] for row in self.cells]
+    self.row_mask = [0] * 9
+    self.col_mask = [0] * 9
+    self.box_mask = [0] * 9
+    self.empty_count = 0
+    self.initialize_masks()
     self.candidates = self.initialize_candidates()
     self.colors = Colors()
     self.validator = Validator()
+    # Rendered text for each digit, indexed by value; index 0 is unused
+    self.digit_text = [" "] + [str(num) for num in range(1, 10)]
+    self.original_text = [" "] + [self.colors.red(num) for num in range(1, 10)]
+    # Originals are only highlighted when writing to a terminal
+    self.use_color = sys.stdout.isatty()
 
     self.update_candidates_backtracking()
     assert self.validator.validate(self.cells), "Illegal Numbers Input"
@@ -17,64 +49,83 @@ class Board:
   def string_to_board(self, board_string):
     """Converts a string representation of a Sudoku board to a 2D list."""
     assert len(board_string) == 81, "Illegal Board String"
-    assert all(char in '0123456789' for char in board_string), "Illegal Board String"
 
-    board = []
-    for i in range(0, len(board_string), 9):
-      row = [
-          int(char) if char != '0' else None for char in board_string[i:i + 9]
-      ]
-      board.append(row)
-    return board
+    values = board_string.encode("ascii", "replace").translate(CHAR_TO_DIGIT)
+    assert max(values) <= 9, "Illegal Board String"
+
+    return [
+        [CELL_VALUES[value] for value in values[i:i + 9]]
+        for i in range(0, 81, 9)]
+
+  def initialize_masks(self):
+    """Builds the row, column and box bitmasks of the numbers on the board."""
+    for row in range(9):
+      for col in range(9):
+        num = self.cells[row][col]
+        if num is not None:
+          self._mark(row, col, digit_bit(num))
+        else:
+          self.empty_count += 1
 
   def initialize_candidates(self):
-    """Initializes the candidates for each cell."""
+    """Initializes the candidate bitmask for each cell."""
     candidates = [
-      [set(range(1, 10)) if cell is None else set() for cell in row] 
+      [ALL_DIGITS if cell is None else 0 for cell in row]
         for row in self.cells]
     return candidates
 
- # Candidate Functions ========================================================
+  # Cell Functions =============================================================
 
-  def update_candidates_on_insert(self, updated_row, updated_col):
-    """Updates the candidates for each cell based on the new value inserted."""
-    inserted_value = self.cells[updated_row][updated_col]
-    
-    box_row_start = (updated_row // 3) * 3
-    box_col_start = (updated_col // 3) * 3
+  def set_cell(self, row, col, num):
+    """Places num at (row, col) and records it in the unit bitmasks."""
+    self.cells[row][col] = num
+    self.empty_count -= 1
+    self._mark(row, col, digit_bit(num))
 
-    self.candidates[updated_row][updated_col] = set()
+  def clear_cell(self, row, col):
+    """Empties (row, col) and removes its number from the unit bitmasks."""
+    bit = digit_bit(self.cells[row][col])
+    self.cells[row][col] = None
+    self.empty_count += 1
+    self.row_mask[row] &= ~bit
+    self.col_mask[col] &= ~bit
+    self.box_mask[BOX_OF[row][col]] &= ~bit
 
-    # Update candidates in the row
-    for col in range(9):
-        if col != updated_col:
-            self.candidates[updated_row][col].discard(inserted_value)
+  def _mark(self, row, col, bit):
+    self.row_mask[row] |= bit
+    self.col_mask[col] |= bit
+    self.box_mask[BOX_OF[row][col]] |= bit
 
-    # Update candidates in the column
-    for row in range(9):
-        if row != updated_row:
-            self.candidates[row][updated_col].discard(inserted_value)
+ # Candidate Functions ========================================================
 
-    # Update candidates in the box
-    for row in range(box_row_start, box_row_start + 3):
-        for col in range(box_col_start, box_col_start + 3):
-            if row != updated_row or col != updated_col:
-                self.candidates[row][col].discard(inserted_value)
+  def update_candidates_on_insert(self, updated_row, updated_col):
+    """Removes the inserted value from the candidates of the cell's 20 peers."""
+    keep_mask = ~digit_bit(self.cells[updated_row][updated_col])
+    candidates = self.candidates
+
+    candidates[updated_row][updated_col] = 0
+    for row, col in PEERS[updated_row][updated_col]:
+      candidates[row][col] &= keep_mask
 
-  
   def update_candidates_backtracking(self):
     """Updates the candidates for each cell based on the current board state."""
+    cells = self.cells
+    candidates = self.candidates
+    row_mask = self.row_mask
+    col_mask = self.col_mask
+    box_mask = self.box_mask
+
     for row in range(9):
+      cells_row = cells[row]
+      candidates_row = candidates[row]
+      box_row = BOX_OF[row]
+      free = ALL_DIGITS & ~row_mask[row]
       for col in range(9):
-        if self.cells[row][col] is None:
-          possible_numbers = set(range(1, 10))
-          possible_numbers -= self.get_row_numbers(row)
-          possible_numbers -= self.get_col_numbers(col)
-          possible_numbers -= self.get_box_numbers(row, col)
-          self.candidates[row][col] = possible_numbers
+        if cells_row[col] is None:
+          candidates_row[col] = free & ~(col_mask[col] | box_mask[box_row[col]])
         else:
-          self.candidates[row][col] = set()
-         
+          candidates_row[col] = 0
+
   # Validator Functions =======================================================
   
   def check_placement(self, num, row, col):
@@ -84,7 +135,7 @@ class Board:
     return self.validator.check_placement(num, row_nums, col_nums, box_nums)
  
   def is_solved(self):
-    return self.validator.is_solved(self.cells)
+    return self.empty_count == 0
   
   
   # Getter Functions ==========================================================
@@ -93,97 +144,76 @@ class Board:
     return self.cells[row]
           
   def get_row_numbers(self, row):
-    """Returns a set of numbers present in the specified row."""
-    return {
-        self.cells[row][col]
-        for col in range(9) if self.cells[row][col] is not None
-    }
+    """Returns a bitmask of the numbers present in the specified row."""
+    return self.row_mask[row]
   
   def get_col_list(self,col):
     return [row[col] for row in self.cells]
 
   def get_col_numbers(self, col):
-    """Returns a set of numbers present in the specified column."""
-    return {
-        self.cells[row][col]
-        for row in range(9) if self.cells[row][col] is not None
-    }
+    """Returns a bitmask of the numbers present in the specified column."""
+    return self.col_mask[col]
 
   def get_box_numbers(self, row, col):
-    """Returns a set of numbers in the 3x3 box containing the cell at (row, col)."""
-    box_row_start = (row // 3) * 3
-    box_col_start = (col // 3) * 3
-    box_numbers = {
-        self.cells[r][c]
-        for r in range(box_row_start, box_row_start + 3)
-        for c in range(box_col_start, box_col_start + 3)
-        if self.cells[r][c] is not None
-    }
-    return box_numbers
+    """Returns a bitmask of the numbers in the 3x3 box containing (row, col)."""
+    return self.box_mask[BOX_OF[row][col]]
   
 
   # Display Functions====================================================================
 
   def display_board(self):
     """Display the board with original values in red"""
-    print("+" + "---+" * 9)
+    lines = [BOX_BORDER]
     for i, row in enumerate(self.cells):
-      formatted_row = []
-
-      for j in range(9):
-        cell_value = self.cells[i][j]
-        original_value = self.original[i][j]
-
-        if cell_value == original_value and cell_value is not None:
-          formatted_value = self.colors.red(str(cell_value))
-        else:
-          formatted_value = " " if cell_value is None else str(cell_value)
+      if self.use_color:
+        formatted_row = []
+        original_row = self.original[i]
+
+        for j in range(9):
+          cell_value = row[j]
+          original_value = original_row[j]
+
+          if cell_value is None:
+            formatted_value = " "
+          elif cell_value == original_value:
+            formatted_value = self.original_text[cell_value]
+          else:
+            formatted_value = self.digit_text[cell_value]
 
-        formatted_row.append(formatted_value)
+          formatted_row.append(formatted_value)
+      else:
+        formatted_row = [
+            " " if cell_value is None else self.digit_text[cell_value]
+            for cell_value in row]
 
-      print(("|" + " {}   {}   {} |" * 3).format(*formatted_row))
+      lines.append(ROW_FORMAT.format(*formatted_row))
 
       if i % 3 == 2:
-        print("+" + "---+" * 9)
+        lines.append(BOX_BORDER)
       else:
-        print("+" + "   +" * 9)
+        lines.append(CELL_BORDER)
+    print("\n".join(lines))
 
   def display_candidates(self):
     """TODO: Update to a GUI"""
     row_list = [num for row in self.candidates for num in self.get_candidate_row(row)]
-    border = "+" + ("═" * 9 + "+") * 9
-    mid_border = "+" + ("-" * 9 + "+") * 9
 
-    print(border)
+    lines = [CANDIDATE_BOX_BORDER]
     for i, row in enumerate(row_list):
         if i > 0:
             if i % 9 == 0:
-                print(border)
+                lines.append(CANDIDATE_BOX_BORDER)
             elif i % 3 == 0:
-                print(mid_border)
-        
-        row_string = '‖'
-        for j, num in enumerate(row, 1):
-            row_string += f" {num} "
-            if j % 9 == 0:
-                row_string += '‖'
-            elif j % 3 == 0:
-                row_string += '|'
+                lines.append(CANDIDATE_CELL_BORDER)
         
-        print(row_string)
+        lines.append(CANDIDATE_ROW_FORMAT.format(*row))
     
-    print(border)
+    lines.append(CANDIDATE_BOX_BORDER)
+    print("\n".join(lines))
 
   def get_candidate_row(self, candidates_row):
-    rows = []
-    for i in range(3):
-      row = []
-      for candidates in candidates_row:
-        for num in range(i * 3 + 1, i * 3 + 4):
-          if num in candidates:
-            row.append(num)
-          else:
-            row.append(" ")
-      rows.append(row)
+    rows = [[], [], []]
+    for candidates in candidates_row:
+      for row, segment in zip(rows, CANDIDATE_DISPLAY[candidates]):
+        row.extend(segment)
     return rows
-
@@ -0,0 +1,24 @@
+'''
+Board geometry tables, built once at import.
+
+Cells are (row, col) tuples; boxes are numbered 0..8 left to right, top to
+bottom.
+'''
+
+# Box index of every cell, the cells of every row, column and box (together
+# the 27 units), and the 20 peers sharing a unit with each cell
+BOX_OF = [[(row // 3) * 3 + col // 3 for col in range(9)] for row in range(9)]
+ROW_CELLS = [[(row, col) for col in range(9)] for row in range(9)]
+COL_CELLS = [[(row, col) for row in range(9)] for col in range(9)]
+BOX_CELLS = [
+    [(row, col)
+     for row in range((box // 3) * 3, (box // 3) * 3 + 3)
+     for col in range((box % 3) * 3, (box % 3) * 3 + 3)]
+    for box in range(9)]
+UNITS = ROW_CELLS + COL_CELLS + BOX_CELLS
+PEERS = [
+    [tuple(sorted(
+        (set(ROW_CELLS[row]) | set(COL_CELLS[col])
+         | set(BOX_CELLS[BOX_OF[row][col]])) - {(row, col)}))
+     for col in range(9)]
+    for row in range(9)]
@@ -1,3 +1,6 @@
+from board.bitmask import digit_bit
+from board.units import UNITS
+
 class Validator:
 
   def __init__(self):
@@ -12,14 +15,11 @@ class Validator:
 
  
   def check_placement(self, num, row_nums, col_nums, box_nums):
-      """Check if placing num at board[row][col] is valid."""
-      if num in row_nums:
-          return False
-      if num in col_nums:
-          return False
-      if num in box_nums:
-          return False
-      return True
+      """Check if placing num at board[row][col] is valid.
+
+      row_nums, col_nums and box_nums are bitmasks of the numbers present.
+      """
+      return not (row_nums | col_nums | box_nums) & digit_bit(num)
 
 
   def validate(self, cells):
@@ -30,23 +30,9 @@ class Validator:
       values = [num for num in group if num is not None]
       return len(values) == len(set(values))
 
-    # Check rows
-    for row in cells:
-      if not is_valid_group(row):
+    # Check rows, columns and 3x3 boxes
+    for unit in UNITS:
+      if not is_valid_group([cells[row][col] for row, col in unit]):
         return False
 
-    # Check columns
-    for col in range(9):
-      if not is_valid_group([cells[row][col] for row in range(9)]):
-        return False
-
-    # Check 3x3 boxes
-    for box_row in range(0, 9, 3):
-      for box_col in range(0, 9, 3):
-        box_values = [
-            cells[box_row + r][box_col + c] for r in range(3) for c in range(3)
-        ]
-        if not is_valid_group(box_values):
-          return False
-
     return True
\ No newline at end of file
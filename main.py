@@ -1,27 +1,35 @@
 # main.py
+import argparse
 from sudoku import Sudoku
-from board.board import Board 
+from board.board import Board
 from solvers.solver_factory import SolverFactory
-from solvers.backtracking_solver import BacktrackingSolver
+
+# Example Sudoku puzzle string
+# This string represents one of the easiest boards
+DEFAULT_PUZZLE = "300967001040302080020000070070000090000873000500010003004705100905000207800621004"
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Solve a Sudoku puzzle.")
+    parser.add_argument("--puzzle", default=DEFAULT_PUZZLE,
+                        help="81 digit board string, 0 for empty cells")
+    parser.add_argument("--solver", default="Strategic",
+                        choices=list(SolverFactory.SOLVERS))
+    parser.add_argument("--mode", default="Default",
+                        choices=["Default", "Verbose"])
+    return parser.parse_args()
 
 def main():
-    # Example Sudoku puzzle string
-    # This string represents one of the easiest boards
-    board_string = "300967001040302080020000070070000090000873000500010003004705100905000207800621004"
+    args = parse_args()
     # Create the Board
-    board = Board(board_string)
+    board = Board(args.puzzle)
     # Create the Solver
-    # solver  = SolverFactory().create_solver(board, solverType="Backtracking")
-    solver = SolverFactory().create_solver(board, solverType="Strategic")
+    solver = SolverFactory().create_solver(board, solverType=args.solver, mode=args.mode)
     # Create Sudoku Game
     sudoku = Sudoku(board, solver)
-    # Solve The Sudoku 
+    # Solve The Sudoku
     sudoku.board.display_board()
     sudoku.solve()
     sudoku.board.display_board()
-    
+
 if __name__ == "__main__":
     main()
-
-
-
@@ -1,5 +1,8 @@
 from solvers.solver import Solver
+from board.units import BOX_OF, ROW_CELLS, COL_CELLS, BOX_CELLS
+from board.bitmask import ALL_DIGITS, popcount
 class BacktrackingSolver(Solver):
+  __slots__ = ()
 
   def __init__(self, board, mode = "Default"):
     super().__init__(board, mode)
@@ -9,29 +12,142 @@ class BacktrackingSolver(Solver):
   
   def solve(self):
         """Solve the Sudoku puzzle using backtracking."""
-        self.board.update_candidates_backtracking()  # Update candidates before starting
-        if self._solve_board():
-            return True
-        else:
-            return False
+        solved = self._solve_board()
+        self.board.update_candidates_backtracking()  # Candidates are not tracked during the search
+        return solved
     
   def _solve_board(self):
-      """Recursive helper function to solve the Sudoku board."""
+      """
+      Depth-first search over the most constrained cells, using an explicit
+      stack of (row, col, untried numbers, forced cells) instead of recursion.
+      Singles forced by each placement are filled in before branching again.
+      """
+      board = self.board
+      stack = []
+      initial = []
+      if not self._propagate(initial):
+          self._undo(initial)
+          return False
+
+      cell = self._most_constrained_cell()
+      while cell is not None:
+          row, col, available = cell
+          if available:
+              # Place the lowest untried number and go one level deeper
+              bit = available & -available
+              board.set_cell(row, col, bit.bit_length())
+              forced = []
+              stack.append((row, col, available ^ bit, forced))
+              if self._propagate(forced):
+                  cell = self._most_constrained_cell()
+                  continue
+
+          # No valid number here, backtrack to the last cell with numbers left
+          while stack:
+              row, col, remaining, forced = stack.pop()
+              self._undo(forced)
+              board.clear_cell(row, col)
+              if remaining:
+                  cell = (row, col, remaining)
+                  break
+          else:
+              self._undo(initial)
+              return False  # Every branch failed
+
+      return True  # All cells are filled
+
+  def _propagate(self, placed):
+      """
+      Fills naked singles (cells with one available number) and hidden
+      singles (numbers with one available cell in a unit) until none remain.
+
+      Args:
+          placed (list): Receives the (row, col) of every cell filled, so the
+                         caller can undo them.
+
+      Returns:
+          bool: False if a cell or a unit was left with no option.
+      """
+      board = self.board
+      cells = board.cells
+      row_mask = board.row_mask
+      col_mask = board.col_mask
+      box_mask = board.box_mask
+      unit_groups = ((row_mask, ROW_CELLS), (col_mask, COL_CELLS), (box_mask, BOX_CELLS))
+      progress = True
+      while progress:
+          progress = False
+
+          # Naked singles
+          for row in range(9):
+              cells_row = cells[row]
+              box_row = BOX_OF[row]
+              for col in range(9):
+                  if cells_row[col] is None:
+                      available = ALL_DIGITS & ~(
+                          row_mask[row] | col_mask[col] | box_mask[box_row[col]])
+                      if not available:
+                          return False
+                      if not available & (available - 1):
+                          board.set_cell(row, col, available.bit_length())
+                          placed.append((row, col))
+                          progress = True
+
+          # Hidden singles, reading each unit's placed numbers from its mask
+          for unit_masks, units in unit_groups:
+              for index, unit in enumerate(units):
+                  seen_once = seen_twice = 0
+                  for row, col in unit:
+                      if cells[row][col] is None:
+                          available = ALL_DIGITS & ~(
+                              row_mask[row] | col_mask[col] | box_mask[BOX_OF[row][col]])
+                          seen_twice |= seen_once & available
+                          seen_once |= available
+                  if ALL_DIGITS & ~(seen_once | unit_masks[index]):
+                      return False  # A number has nowhere to go in this unit
+
+                  singles = seen_once & ~seen_twice
+                  if singles:
+                      for row, col in unit:
+                          if cells[row][col] is None:
+                              available = singles & ~(
+                                  row_mask[row] | col_mask[col] | box_mask[BOX_OF[row][col]])
+                              if available:
+                                  board.set_cell(row, col, (available & -available).bit_length())
+                                  placed.append((row, col))
+                                  progress = True
+      return True
+
+  def _undo(self, placed):
+      """Clears the given cells, most recent first."""
+      for row, col in reversed(placed):
+          self.board.clear_cell(row, col)
+
+  def _most_constrained_cell(self):
+      """
+      Finds the empty cell with the fewest available numbers.
+
+      Returns:
+          tuple: (row, col, available) where available is a bitmask of the
+                 numbers that can be placed, or None if the board is full.
+      """
+      board = self.board
+      row_mask = board.row_mask
+      col_mask = board.col_mask
+      box_mask = board.box_mask
+      best = None
+      best_count = 10
       for row in range(9):
+          cells_row = board.cells[row]
+          box_row = BOX_OF[row]
+          free = ALL_DIGITS & ~row_mask[row]
           for col in range(9):
-              if self.board.cells[row][col] is None:
-                  for num in self.board.candidates[row][col]:
-                      if self.board.check_placement(num, row, col):
-                          self.board.cells[row][col] = num
-                          self.board.update_candidates_backtracking()  # Update candidates after placing a number
- 
-                          if self._solve_board():
-                              return True  # Solution found
-                          
-                          # If no solution, backtrack
-                          self.board.cells[row][col] = None
-                          self.board.update_candidates_backtracking()
-
-                  return False  # No valid number found, need to backtrack
-              
-      return True  # All cells are filled
+              if cells_row[col] is None:
+                  available = free & ~(col_mask[col] | box_mask[box_row[col]])
+                  count = popcount(available)
+                  if count < best_count:
+                      best = (row, col, available)
+                      best_count = count
+                      if count <= 1:
+                          return best  # Forced or dead end, no need to look further
+      return best
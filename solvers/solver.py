@@ -1,16 +1,18 @@
 class Solver:
+  __slots__ = ("board", "mode")
+  MODES = frozenset(("Default", "Verbose"))
 
   def __init__(self, board, mode = "Default"):
-    self.modeSet = {"Default", "Verbose"}
     self.board = board
 
-    if mode in self.modeSet:
+    if mode in self.MODES:
         self.mode = mode
     else:
        self.mode = "Default"
 
-  def display(self, str):
+  def display(self, message, *args):
+    """Prints message in Verbose mode, %-formatting it with args only then."""
     if(self.mode == "Verbose"):
-      print(str)
+      print(message % args if args else message)
     else:
       pass
\ No newline at end of file
@@ -2,16 +2,16 @@ from solvers.backtracking_solver import BacktrackingSolver
 from solvers.strategic_solver import StrategicSolver
 
 class SolverFactory:
+    SOLVERS = {
+        "Backtracking": BacktrackingSolver,
+        "Strategic": StrategicSolver,
+    }
+
     @staticmethod
     def create_solver( board, solverType="Backtracking", mode="Default"):
-        # Create and return an instance of BacktrackingSolver
-        match solverType:
-            case "Backtracking":
-                print("Creating a Backtracking Solver")
-                return BacktrackingSolver(board, mode)
-            case "Strategic":
-                print("Creating a Strategic Solver")
-                return StrategicSolver(board, mode)
-            case _:
-                print("Creating a Backtracking Solver")
-                return BacktrackingSolver(board, mode)
\ No newline at end of file
+        # Create and return an instance of the requested solver, falling back to Backtracking
+        if solverType not in SolverFactory.SOLVERS:
+            solverType = "Backtracking"
+        if mode == "Verbose":
+            print(f"Creating a {solverType} Solver")
+        return SolverFactory.SOLVERS[solverType](board, mode)
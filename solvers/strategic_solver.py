@@ -1,11 +1,18 @@
 from solvers.solver import Solver
+from board.bitmask import digit_bit
 from strategies.single_candidate import SingleCandidateStrategy
 class StrategicSolver(Solver):
+    __slots__ = ("strategies", "current_strategy", "values_to_insert",
+                 "candidates_to_eliminate")
+
+    # Strategies are stateless, so every solver shares the same instances
+    STRATEGIES = (
+        SingleCandidateStrategy(),
+    )
+
     def __init__(self, board, mode = "Default"):
         super().__init__(board, mode)
-        self.strategies = [
-            SingleCandidateStrategy(self.board)
-        ]
+        self.strategies = self.STRATEGIES
         # State storing variables
         self.current_strategy = None
         self.values_to_insert = []
@@ -26,10 +33,10 @@ class StrategicSolver(Solver):
         """
         self.current_strategy = None
         for strategy in self.strategies:
-            result = strategy.process()
+            result = strategy.process(self.board)
             if(result):
                 self.current_strategy = strategy
-                self.display("Found Strategy: "+self.current_strategy.name)
+                self.display("Found Strategy: %s", self.current_strategy.name)
                 match (self.current_strategy.type):
                     case "Value Finder":
                         self.values_to_insert = result
@@ -58,18 +65,23 @@ class StrategicSolver(Solver):
                 updates = self.candidates_to_eliminate
                 self.candidates_to_eliminate = []
             elif(self.values_to_insert):
-                self._insert_values()
-                updates = self.values_to_insert
-                self.values_to_insert = []
+                # Keep inserting until the strategy stops finding values, instead
+                # of going back through the state machine for every round
+                while(self.values_to_insert):
+                    self._insert_values()
+                    updates.extend(self.values_to_insert)
+                    self.values_to_insert = self.current_strategy.process(self.board)
         return updates
             
     def _eliminate_candidates(self):
-        pass
+        for value in self.candidates_to_eliminate:
+            row,col,num = value
+            self.board.candidates[row][col] &= ~digit_bit(num)
     
     def _insert_values(self):
         for value in self.values_to_insert:
             row,col,num = value
-            self.board.cells[row][col] = num
+            self.board.set_cell(row, col, num)
             self.board.update_candidates_on_insert(row,col)
 
     
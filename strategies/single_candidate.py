@@ -1,4 +1,5 @@
 from strategies.strategy import Strategy
+from board.bitmask import popcount
 
 '''
 This strategy effectively handles various scenarios where a cell's value can 
@@ -14,18 +15,19 @@ Reference: https://www.sudokuwiki.org/Getting_Started
 '''
 
 class SingleCandidateStrategy(Strategy):
-    def __init__(self, board):
-        super().__init__(board, name="Single Candidate Strategy", type="Value Finder")
+    __slots__ = ()
+
+    def __init__(self):
+        super().__init__(name="Single Candidate Strategy", type="Value Finder")
 
 
     
-    def process(self):
+    def process(self, board):
         values_to_insert = []
-        for row in range(9):
-            for col in range(9):
-                if self.board.cells[row][col] is None:
-                    possible_values = self.board.candidates[row][col]
-                    if len(possible_values) == 1:
-                        values_to_insert.append((row, col, possible_values.pop()))
+        # Filled cells have no candidates, so only empty cells can match
+        for row, candidates_row in enumerate(board.candidates):
+            for col, possible_values in enumerate(candidates_row):
+                if popcount(possible_values) == 1:
+                    values_to_insert.append((row, col, possible_values.bit_length()))
         return values_to_insert
     
\ No newline at end of file
@@ -1,15 +1,19 @@
 class Strategy:
-    def __init__(self, board, name, type):
-        self.board = board
+    __slots__ = ("name", "type")
+
+    def __init__(self, name, type):
         self.name = name
         self.type = type
     
  
-    def process(self):
+    def process(self, board):
         """
-        Find and return candidates for this strategy. This method should be
-        overridden by specific strategy implementations to identify which
-        cells or values are relevant for the strategy.
+        Find and return candidates for this strategy on the given board. This
+        method should be overridden by specific strategy implementations to
+        identify which cells or values are relevant for the strategy.
+
+        Strategies hold no board state, so one instance can be shared by
+        every solver.
         """ 
         
         raise NotImplementedError("Strategy must implement the process method.")